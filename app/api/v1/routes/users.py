@@ -2,36 +2,49 @@
 User API routes.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.logging import api_logger
-from app.db.database import get_db
+from app.core.responses import dump_models, json_bytes_response, model_response
+from app.db.database import AsyncSessionLocal, get_db
 from app.models.user import UserCreate, UserResponse, UserUpdate
 from app.services.user_service import UserService
+from app.utils.cache import AsyncTTLCache
 
 router = APIRouter()
 
+# Serializers for returning ORM objects as pre-encoded JSON
+user_adapter = TypeAdapter(UserResponse)
+user_list_adapter = TypeAdapter(List[UserResponse])
+
+# Encoded user list pages keyed by (after_id, limit); cleared on every write
+users_cache = AsyncTTLCache(ttl=settings.users_cache_ttl)
+
 
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    after_id: Optional[int] = None,
+    # Bounded so cached pages stay small and invalid limits fail with 422
+    limit: int = Query(100, ge=1, le=100),
 ):
-    """Get all users with pagination."""
-    api_logger.info("Fetching users list", extra={"skip": skip, "limit": limit})
+    """Get users with keyset pagination; pass the last seen ID as ``after_id``."""
+    api_logger.debug("Fetching users list", after_id=after_id, limit=limit)
 
-    user_service = UserService(db)
-    users = await user_service.get_users(skip=skip, limit=limit)
+    async def load_page() -> tuple[int, bytes]:
+        # The shared load can outlive this request, so it opens its own session
+        async with AsyncSessionLocal() as db:
+            users = await UserService.get_users(db, after_id=after_id, limit=limit)
+        return len(users), dump_models(user_list_adapter, users)
 
-    api_logger.info(
-        "Users list fetched successfully",
-        extra={"count": len(users), "skip": skip, "limit": limit},
-    )
-    return users
+    count, content = await users_cache.get_or_load((after_id, limit), load_page)
+
+    api_logger.info("Users list fetched successfully", count=count)
+    return json_bytes_response(content)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -40,21 +53,18 @@ async def get_user(
     db: AsyncSession = Depends(get_db),
 ):
     """Get user by ID."""
-    api_logger.info("Fetching user", extra={"user_id": user_id})
+    api_logger.debug("Fetching user", user_id=user_id)
 
-    user_service = UserService(db)
-    user = await user_service.get_user(user_id)
+    user = await UserService.get_user(db, user_id)
     if not user:
-        api_logger.warning("User not found", extra={"user_id": user_id})
+        api_logger.warning("User not found", user_id=user_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    api_logger.info(
-        "User fetched successfully", extra={"user_id": user_id, "email": user.email}
-    )
-    return user
+    api_logger.info("User fetched successfully", user_id=user_id, email=user.email)
+    return model_response(user_adapter, user)
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -63,31 +73,13 @@ async def create_user(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new user."""
-    api_logger.info(
-        "Creating new user",
-        extra={"email": user_data.email, "first_name": user_data.first_name},
-    )
+    api_logger.debug("Creating new user", email=user_data.email)
 
-    user_service = UserService(db)
+    user = await UserService.create_user(db, user_data)
+    users_cache.invalidate()
 
-    # Check if user already exists
-    existing_user = await user_service.get_user_by_email(user_data.email)
-    if existing_user:
-        api_logger.warning(
-            "Attempt to create user with existing email",
-            extra={"email": user_data.email},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
-    user = await user_service.create_user(user_data)
-
-    api_logger.info(
-        "User created successfully", extra={"user_id": user.id, "email": user.email}
-    )
-    return user
+    api_logger.info("User created successfully", user_id=user.id, email=user.email)
+    return model_response(user_adapter, user, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -97,34 +89,21 @@ async def update_user(
     db: AsyncSession = Depends(get_db),
 ):
     """Update user by ID."""
-    api_logger.info(
+    api_logger.debug(
         "Updating user",
-        extra={
-            "user_id": user_id,
-            "update_fields": user_data.model_dump(exclude_unset=True),
-        },
+        user_id=user_id,
+        update_fields=user_data.model_fields_set,
     )
 
-    user_service = UserService(db)
+    updated_user = await UserService.update_user(db, user_id, user_data)
+    users_cache.invalidate()
 
-    user = await user_service.get_user(user_id)
-    if not user:
-        api_logger.warning(
-            "Attempt to update non-existent user", extra={"user_id": user_id}
-        )
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-
-    updated_user = await user_service.update_user(user_id, user_data)
-
-    if updated_user:
-        api_logger.info(
-            "User updated successfully",
-            extra={"user_id": user_id, "email": updated_user.email},
-        )
-    return updated_user
+    api_logger.info(
+        "User updated successfully",
+        user_id=user_id,
+        email=updated_user.email,
+    )
+    return model_response(user_adapter, updated_user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -133,20 +112,9 @@ async def delete_user(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete user by ID."""
-    api_logger.info("Deleting user", extra={"user_id": user_id})
-
-    user_service = UserService(db)
-
-    user = await user_service.get_user(user_id)
-    if not user:
-        api_logger.warning(
-            "Attempt to delete non-existent user", extra={"user_id": user_id}
-        )
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+    api_logger.debug("Deleting user", user_id=user_id)
 
-    await user_service.delete_user(user_id)
+    await UserService.delete_user(db, user_id)
+    users_cache.invalidate()
 
-    api_logger.info("User deleted successfully", extra={"user_id": user_id})
+    api_logger.info("User deleted successfully", user_id=user_id)
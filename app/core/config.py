@@ -2,7 +2,7 @@
 Application configuration management using Pydantic Settings.
 """
 
-from functools import lru_cache
+from functools import cached_property
 from typing import Annotated
 
 from pydantic import Field, computed_field
@@ -27,7 +27,7 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
 
     # Logging
-    log_level: str = "INFO"
+    log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL or NONE
     log_format: str = "json"  # json, text, or structured
     log_file: str | None = "logs/app.log"  # Optional log file path
     log_max_size: int = 10  # MB
@@ -45,10 +45,22 @@ class Settings(BaseSettings):
     postgres_user: str = "postgres"
     postgres_password: str = "password"
     postgres_db: str = "fastapi_template"
+    db_pool_size: int = 20  # persistent connections kept open
+    db_max_overflow: int = 30  # extra connections allowed under burst load
+    db_pool_recycle: int = 1800  # seconds before a connection is recycled
+
+    # Compression
+    enable_gzip: bool = True
+    gzip_minimum_size: int = 1024  # bytes
+    gzip_compress_level: int = 6  # 1 (fastest) - 9 (smallest)
+
+    # Caching
+    users_cache_ttl: float = 5.0  # seconds, 0 disables the user list cache
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def database_url(self) -> str:
+        """Async database URL, built once on first access."""
         return (
             f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
             f"@{self.postgres_server}:{self.postgres_port}/{self.postgres_db}"
@@ -60,11 +72,10 @@ class Settings(BaseSettings):
     model_config = {"env_file": ".env", "case_sensitive": False}
 
 
-@lru_cache
-def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+# Global settings instance
+settings = Settings()
 
 
-# Global settings instance
-settings = get_settings()
+def get_settings() -> Settings:
+    """Get application settings (usable as a FastAPI dependency)."""
+    return settings
@@ -2,36 +2,72 @@
 Global exception handlers for comprehensive error logging and response formatting.
 """
 
-import traceback
+from typing import Any, Dict
 
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.logging import app_logger, security_logger
+from app.core.responses import ORJSONResponse
 
 
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+class AppException(Exception):
+    """Base class for application errors that map to an HTTP response."""
+
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    detail: str = "Internal server error"
+
+    def __init__(self, detail: str | None = None):
+        if detail is not None:
+            self.detail = detail
+        super().__init__(self.detail)
+
+
+class NotFoundError(AppException):
+    """Raised when a requested resource does not exist."""
+
+    status_code = status.HTTP_404_NOT_FOUND
+    detail = "Resource not found"
+
+
+class AlreadyExistsError(AppException):
+    """Raised when creating a resource that conflicts with an existing one."""
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Resource already exists"
+
+
+def _request_log_fields(request: Request, request_id: str) -> Dict[str, Any]:
+    """Common request fields attached to every exception log."""
+    return {"request_id": request_id, "url": str(request.url), "method": request.method}
+
+
+def _exception_log_fields(
+    request: Request, request_id: str, exc: Exception
+) -> Dict[str, Any]:
+    """Log fields for unexpected exceptions (the traceback goes via exc_info)."""
+    return {
+        **_request_log_fields(request, request_id),
+        "exception_type": type(exc).__name__,
+        "exception_message": str(exc),
+    }
+
+
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Global exception handler for unhandled exceptions."""
     request_id = getattr(request.state, "request_id", "unknown")
 
     # Log the full exception with traceback
     app_logger.error(
         "Unhandled exception occurred",
-        extra={
-            "request_id": request_id,
-            "url": str(request.url),
-            "method": request.method,
-            "exception_type": type(exc).__name__,
-            "exception_message": str(exc),
-            "traceback": traceback.format_exc(),
-        },
+        exc_info=exc,
+        **_exception_log_fields(request, request_id, exc),
     )
 
     # Return generic error response (don't expose internal details)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -41,41 +77,39 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(
+    request: Request, exc: HTTPException
+) -> ORJSONResponse:
     """Handler for HTTP exceptions."""
     request_id = getattr(request.state, "request_id", "unknown")
 
     # Log based on status code severity
     log_data = {
-        "request_id": request_id,
-        "url": str(request.url),
-        "method": request.method,
+        **_request_log_fields(request, request_id),
         "status_code": exc.status_code,
         "detail": exc.detail,
     }
 
     if exc.status_code >= 500:
-        app_logger.error("Server error", extra=log_data)
+        app_logger.error("Server error", **log_data)
     elif exc.status_code >= 400:
-        app_logger.warning("Client error", extra=log_data)
+        app_logger.warning("Client error", **log_data)
     else:
-        app_logger.info("HTTP exception", extra=log_data)
+        app_logger.info("HTTP exception", **log_data)
 
     # Log security-relevant errors
     if exc.status_code in [401, 403, 404]:
         security_logger.warning(
             "Security-relevant HTTP error",
-            extra={
-                **log_data,
-                "client_ip": request.headers.get(
-                    "x-forwarded-for",
-                    request.client.host if request.client else "unknown",
-                ),
-                "user_agent": request.headers.get("user-agent", ""),
-            },
+            **log_data,
+            client_ip=request.headers.get(
+                "x-forwarded-for",
+                request.client.host if request.client else "unknown",
+            ),
+            user_agent=request.headers.get("user-agent", ""),
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
@@ -85,24 +119,27 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
+async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
+    """Handler for application exceptions raised by the service layer."""
+    return await http_exception_handler(
+        request, HTTPException(status_code=exc.status_code, detail=exc.detail)
+    )
+
+
 async def starlette_http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handler for Starlette HTTP exceptions."""
     request_id = getattr(request.state, "request_id", "unknown")
 
     app_logger.warning(
         "Starlette HTTP exception",
-        extra={
-            "request_id": request_id,
-            "url": str(request.url),
-            "method": request.method,
-            "status_code": exc.status_code,
-            "detail": exc.detail,
-        },
+        **_request_log_fields(request, request_id),
+        status_code=exc.status_code,
+        detail=exc.detail,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
@@ -114,32 +151,27 @@ async def starlette_http_exception_handler(
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handler for request validation errors."""
     request_id = getattr(request.state, "request_id", "unknown")
 
     # Format validation errors
-    validation_errors = []
-    for error in exc.errors():
-        validation_errors.append(
-            {
-                "field": " -> ".join(str(x) for x in error["loc"]),
-                "message": error["msg"],
-                "type": error["type"],
-            }
-        )
+    validation_errors = [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+        }
+        for error in exc.errors()
+    ]
 
     app_logger.warning(
         "Request validation failed",
-        extra={
-            "request_id": request_id,
-            "url": str(request.url),
-            "method": request.method,
-            "validation_errors": validation_errors,
-        },
+        **_request_log_fields(request, request_id),
+        validation_errors=validation_errors,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
@@ -152,23 +184,17 @@ async def validation_exception_handler(
 
 async def database_exception_handler(
     request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handler for database-related exceptions."""
     request_id = getattr(request.state, "request_id", "unknown")
 
     app_logger.error(
         "Database error occurred",
-        extra={
-            "request_id": request_id,
-            "url": str(request.url),
-            "method": request.method,
-            "exception_type": type(exc).__name__,
-            "exception_message": str(exc),
-            "traceback": traceback.format_exc(),
-        },
+        exc_info=exc,
+        **_exception_log_fields(request, request_id, exc),
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Database error occurred",
@@ -178,12 +204,20 @@ async def database_exception_handler(
     )
 
 
+# Exception type -> handler, registered in one pass by setup_exception_handlers
+EXCEPTION_HANDLERS = {
+    Exception: global_exception_handler,
+    HTTPException: http_exception_handler,
+    AppException: app_exception_handler,
+    StarletteHTTPException: starlette_http_exception_handler,
+    RequestValidationError: validation_exception_handler,
+    SQLAlchemyError: database_exception_handler,
+}
+
+
 def setup_exception_handlers(app) -> None:
     """Setup all exception handlers for the FastAPI app."""
-    app.add_exception_handler(Exception, global_exception_handler)
-    app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(StarletteHTTPException, starlette_http_exception_handler)
-    app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(SQLAlchemyError, database_exception_handler)
+    for exc_class, handler in EXCEPTION_HANDLERS.items():
+        app.add_exception_handler(exc_class, handler)
 
     app_logger.info("Exception handlers configured")
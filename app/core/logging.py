@@ -7,21 +7,92 @@ This module provides:
 - Request/response logging middleware
 - SQL query logging
 - Performance monitoring
+- Non-blocking handlers via a background queue listener
 """
 
-import json
+import atexit
 import logging
+import logging.config
 import logging.handlers
+import queue
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 import structlog
-from structlog.types import Processor
+from structlog.types import EventDict, Processor
 
 from app.core.config import settings
 
+# Standard LogRecord attributes; anything else was passed via ``extra``
+RESERVED_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "message",
+        "asctime",
+    }
+)
+
+
+def get_extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """Return the non-standard attributes attached to a log record."""
+    attrs = record.__dict__
+    # Most records carry no extras; skip building a dict for them
+    if attrs.keys() <= RESERVED_RECORD_ATTRS:
+        return {}
+    return {k: v for k, v in attrs.items() if k not in RESERVED_RECORD_ATTRS}
+
+
+class TimestampCache:
+    """Timestamp formatter that only calls strftime when the second changes."""
+
+    __slots__ = ("fmt", "_cached")
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        self._cached: tuple[int, str] = (-1, "")
+
+    def format_seconds(self, created: float) -> str:
+        """Format the whole-second part of a record timestamp."""
+        seconds = int(created)
+        cached_seconds, formatted = self._cached
+        if seconds != cached_seconds:
+            formatted = time.strftime(self.fmt, time.localtime(seconds))
+            self._cached = (seconds, formatted)
+        return formatted
+
+    def format_micros(self, created: float) -> str:
+        """Format a record timestamp with microsecond precision."""
+        micros = int((created - int(created)) * 1_000_000)
+        return f"{self.format_seconds(created)}.{micros:06d}"
+
+
+# Shared timestamp caches (local time, matching the previous datetime output)
+iso_timestamps = TimestampCache("%Y-%m-%dT%H:%M:%S")
+clock_timestamps = TimestampCache("%H:%M:%S")
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
@@ -29,7 +100,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": iso_timestamps.format_micros(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -43,39 +114,13 @@ class JSONFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields
-        if hasattr(record, "__dict__"):
-            extra_fields = {
-                k: v
-                for k, v in record.__dict__.items()
-                if k
-                not in {
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "message",
-                }
-            }
-            if extra_fields:
-                log_data["extra"] = extra_fields
-
-        return json.dumps(log_data, default=str)
+        extra_fields = get_extra_fields(record)
+        if extra_fields:
+            log_data["extra"] = extra_fields
+
+        return orjson.dumps(
+            log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
 
 
 class PrettyConsoleFormatter(logging.Formatter):
@@ -93,57 +138,50 @@ class PrettyConsoleFormatter(logging.Formatter):
         "DIM": "\033[2m",  # Dim
     }
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with colors and clean layout."""
-        # Parse structured log if it's from structlog
-        message = record.getMessage()
-        extra_data = {}
-
-        try:
-            if message.startswith("{") and '"event":' in message:
-                import json
-
-                data = json.loads(message)
-                message = data.get("event", message)
-                extra_data = data.get("extra", {})
-        except Exception:
-            pass
-
-        # Extract timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-
-        # Color the log level
-        level_color = self.COLORS.get(record.levelname, "")
-        level = f"{level_color}{record.levelname:8}{self.COLORS['RESET']}"
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Per-level line templates, built once instead of on every record
+        self._templates = {
+            level: self._build_template(level)
+            for level in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+        }
 
-        # Color the logger name
-        logger_color = self.COLORS["DIM"]
-        logger_name = f"{logger_color}{record.name}{self.COLORS['RESET']}"
+    def _build_template(self, levelname: str) -> str:
+        """Build the colored line template for a log level."""
+        dim, reset = self.COLORS["DIM"], self.COLORS["RESET"]
+        level_color = self.COLORS.get(levelname, "")
+        return (
+            f"{dim}{{timestamp}}{reset} | {level_color}{levelname:8}{reset} | "
+            f"{dim}{{name}}{reset} | {{message}}"
+        )
 
-        # Format the main message
-        main_msg = (
-            f"{self.COLORS['DIM']}{timestamp}{self.COLORS['RESET']} | "
-            f"{level} | {logger_name} | {message}"
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record with colors and clean layout."""
+        template = self._templates.get(record.levelname)
+        if template is None:
+            template = self._build_template(record.levelname)
+
+        # structlog fields arrive as record attributes, no re-parsing needed
+        main_msg = template.format(
+            timestamp=clock_timestamps.format_seconds(record.created),
+            name=record.name,
+            message=record.getMessage(),
         )
 
-        # Add extra data if present
+        # Add extra data if present, skipping empty values
+        extra_data = get_extra_fields(record)
         if extra_data:
-            extra_items = []
-            for k, v in extra_data.items():
-                if k not in ["taskName"] and v is not None:  # Skip common noise
-                    extra_items.append(f"{k}={v}")
-
+            extra_items = [f"{k}={v}" for k, v in extra_data.items() if v is not None]
             if extra_items:
-                extra_str = (
+                main_msg += (
                     f"{self.COLORS['DIM']} | "
                     f"{' | '.join(extra_items)}{self.COLORS['RESET']}"
                 )
-                main_msg += extra_str
 
         # Add exception info if present
         if record.exc_info:
             exc_text = self.formatException(record.exc_info)
-            main_msg += f"\n{self.COLORS['RED']}{exc_text}{self.COLORS['RESET']}"
+            main_msg += f"\n{self.COLORS['ERROR']}{exc_text}{self.COLORS['RESET']}"
 
         return main_msg
 
@@ -153,45 +191,17 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with structured key-value pairs."""
-        timestamp = datetime.fromtimestamp(record.created).isoformat()
+        timestamp = iso_timestamps.format_micros(record.created)
         base_msg = (
             f"{timestamp} | {record.levelname:8} | "
             f"{record.name} | {record.getMessage()}"
         )
 
         # Add extra fields
-        if hasattr(record, "__dict__"):
-            extra_fields = {
-                k: v
-                for k, v in record.__dict__.items()
-                if k
-                not in {
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "message",
-                }
-            }
-            if extra_fields:
-                extra_str = " | ".join([f"{k}={v}" for k, v in extra_fields.items()])
-                base_msg += f" | {extra_str}"
+        extra_fields = get_extra_fields(record)
+        if extra_fields:
+            extra_str = " | ".join([f"{k}={v}" for k, v in extra_fields.items()])
+            base_msg += f" | {extra_str}"
 
         if record.exc_info:
             base_msg += f"\n{self.formatException(record.exc_info)}"
@@ -199,6 +209,22 @@ class StructuredFormatter(logging.Formatter):
         return base_msg
 
 
+class TextFormatter(logging.Formatter):
+    """Plain text formatter that appends structured fields as key-value pairs."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Format the line, then add extra fields before any traceback."""
+        message = super().formatMessage(record)
+
+        # structlog fields arrive as record attributes, not in the message
+        extra_fields = get_extra_fields(record)
+        if extra_fields:
+            extra_str = " | ".join([f"{k}={v}" for k, v in extra_fields.items()])
+            message += f" | {extra_str}"
+
+        return message
+
+
 def get_formatter() -> logging.Formatter:
     """Get the appropriate formatter based on configuration."""
     if settings.log_format == "json":
@@ -206,7 +232,7 @@ def get_formatter() -> logging.Formatter:
     elif settings.log_format == "structured":
         return StructuredFormatter()
     else:  # text format
-        return logging.Formatter(
+        return TextFormatter(
             "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -221,7 +247,7 @@ def get_console_formatter() -> logging.Formatter:
     elif settings.console_log_format == "structured":
         return StructuredFormatter()
     else:  # text format
-        return logging.Formatter(
+        return TextFormatter(
             "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
             datefmt="%H:%M:%S",
         )
@@ -289,32 +315,65 @@ def setup_error_file_handler() -> Optional[logging.Handler]:
     return handler
 
 
+def render_to_record(
+    logger: logging.Logger, method_name: str, event_dict: EventDict
+) -> Dict[str, Any]:
+    """Pass a structlog event to stdlib logging as a message plus record extras.
+
+    Event fields (keyword arguments, or a legacy ``extra={...}`` dict) become
+    regular record attributes that every formatter reads; names that clash
+    with standard LogRecord attributes get a trailing underscore.
+    """
+    kwargs: Dict[str, Any] = {"msg": event_dict.pop("event")}
+    for key in ("exc_info", "stack_info"):
+        if key in event_dict:
+            kwargs[key] = event_dict.pop(key)
+
+    extra = event_dict.pop("extra", None)
+    if extra:
+        event_dict.update(extra)
+
+    kwargs["extra"] = {
+        (f"{k}_" if k in RESERVED_RECORD_ATTRS else k): v for k, v in event_dict.items()
+    }
+    return kwargs
+
+
 def setup_structlog() -> None:
     """Setup structlog for structured logging."""
+    # Timestamps, levels, logger names and exceptions are rendered by the
+    # stdlib formatters, so structlog only hands the event over
     processors: list[Processor] = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
+        render_to_record,
     ]
 
-    if settings.log_format == "json":
-        processors.append(structlog.processors.JSONRenderer())
-    else:
-        processors.append(structlog.dev.ConsoleRenderer())
-
+    # Calls below the configured level are no-ops that skip the processor chain
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, settings.log_level.upper())
+        ),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands records to the listener thread unformatted."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Enqueue the record, leaving formatting to the listener thread."""
+        try:
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging() -> None:
     """Setup application logging configuration."""
     # Setup structlog
@@ -324,22 +383,27 @@ def setup_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.log_level.upper()))
 
-    # Clear any existing handlers
+    # Stop a previously started listener and release the handlers replaced here
+    stop_logging()
+    for handler in root_logger.handlers:
+        handler.close()
     root_logger.handlers.clear()
 
-    # Add console handler
-    console_handler = setup_console_handler()
-    root_logger.addHandler(console_handler)
+    # Console handler plus optional file and error file handlers
+    handlers = [setup_console_handler()]
 
-    # Add file handler if configured
     file_handler = setup_file_handler()
     if file_handler:
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
-    # Add error file handler
     error_handler = setup_error_file_handler()
     if error_handler:
-        root_logger.addHandler(error_handler)
+        handlers.append(error_handler)
+
+    # Handlers write directly until start_logging() moves them behind the
+    # queue, so no thread is started at import (safe to fork afterwards)
+    for handler in handlers:
+        root_logger.addHandler(handler)
 
     # Configure specific loggers
     configure_external_loggers()
@@ -347,42 +411,131 @@ def setup_logging() -> None:
     # Log configuration
     app_logger.info(
         "Logging configured",
-        extra={
-            "log_level": settings.log_level,
-            "log_format": settings.log_format,
-            "log_file": settings.log_file,
-            "log_rotation": settings.log_rotation,
-            "handlers": len(root_logger.handlers),
-        },
+        log_level=settings.log_level,
+        log_format=settings.log_format,
+        log_file=settings.log_file,
+        log_rotation=settings.log_rotation,
+        handlers=len(handlers),
+    )
+
+
+def _drop_event(self: Any, *args: Any, **kwargs: Any) -> None:
+    """Log method that discards the call."""
+
+
+async def _adrop_event(self: Any, *args: Any, **kwargs: Any) -> None:
+    """Async log method that discards the call."""
+
+
+class SilentBoundLogger(structlog.make_filtering_bound_logger(logging.CRITICAL)):
+    """Filtering logger that drops every level, CRITICAL included.
+
+    structlog only builds filtering loggers for the standard levels, so the
+    CRITICAL one is extended to turn its remaining methods into no-ops too.
+    """
+
+    critical = fatal = msg = log = _drop_event
+    acritical = afatal = amsg = alog = _adrop_event
+
+    def is_enabled_for(self, level: int) -> bool:
+        """No level is enabled."""
+        return False
+
+    def get_effective_level(self) -> int:
+        """Report a level above CRITICAL."""
+        return logging.CRITICAL + 1
+
+
+def disable_logging() -> None:
+    """Turn logging off entirely (``LOG_LEVEL=NONE``) without building handlers."""
+    structlog.configure(
+        processors=[render_to_record],
+        wrapper_class=SilentBoundLogger,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
     )
+    logging.disable(logging.CRITICAL)
+
+
+def start_logging() -> None:
+    """Move the root handlers behind a queue drained by a background listener."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        return
+
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    if not handlers:
+        return
+
+    # The event loop only enqueues records; formatting and I/O run on the
+    # listener thread
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.handlers[:] = [LocalQueueHandler(log_queue)]
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    # Fallback flush at interpreter exit if lifespan shutdown never runs
+    atexit.unregister(stop_logging)
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+
+    # Records logged after shutdown are written directly instead of being
+    # lost, and the next start_logging() picks the handlers up again
+    logging.getLogger().handlers[:] = list(_queue_listener.handlers)
+    _queue_listener = None
 
 
 def configure_external_loggers() -> None:
     """Configure external library loggers."""
+    levels: Dict[str, str] = {}
+
     # SQLAlchemy logging
     if settings.enable_sql_logging:
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+        levels["sqlalchemy.engine"] = "INFO"
         if settings.log_sql_queries:
-            logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.INFO)
+            levels["sqlalchemy.engine.Engine"] = "INFO"
     else:
-        logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
-
-    # Uvicorn logging
-    logging.getLogger("uvicorn.access").setLevel(logging.INFO)
-    logging.getLogger("uvicorn.error").setLevel(logging.INFO)
-
-    # FastAPI logging
-    logging.getLogger("fastapi").setLevel(logging.INFO)
-
-    # Development tools - reduce noise
-    logging.getLogger("watchfiles.main").setLevel(logging.WARNING)  # File watcher
-    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+        levels["sqlalchemy"] = "WARNING"
+
+    levels.update(
+        {
+            # Uvicorn logging
+            "uvicorn.access": "INFO",
+            "uvicorn.error": "INFO",
+            # FastAPI logging
+            "fastapi": "INFO",
+            # Development tools - reduce noise
+            "watchfiles.main": "WARNING",  # File watcher
+            "watchfiles": "WARNING",
+            # Third-party libraries
+            "httpx": "WARNING",
+            "asyncpg": "WARNING",
+            "multipart": "WARNING",
+            "starlette": "WARNING",
+        }
+    )
 
-    # Third-party libraries
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("asyncpg").setLevel(logging.WARNING)
-    logging.getLogger("multipart").setLevel(logging.WARNING)
-    logging.getLogger("starlette").setLevel(logging.WARNING)
+    # Apply all levels in one incremental pass (single lock, one cache reset)
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "incremental": True,
+            "loggers": {name: {"level": level} for name, level in levels.items()},
+        }
+    )
 
 
 class PerformanceLogger:
@@ -407,17 +560,17 @@ class PerformanceLogger:
             )
 
     def log_request_timing(
-        self, method: str, path: str, duration: float, status_code: int
+        self, method: str, path: str, duration_ns: int, status_code: int
     ) -> None:
-        """Log request timing information."""
-        level = logging.WARNING if duration > 1.0 else logging.INFO
+        """Log request timing information (duration in nanoseconds)."""
+        level = logging.WARNING if duration_ns > 1_000_000_000 else logging.INFO
         self.logger.log(
             level,
             "Request completed",
             extra={
                 "method": method,
                 "path": path,
-                "duration_seconds": duration,
+                "duration_us": duration_ns // 1000,
                 "status_code": status_code,
             },
         )
@@ -442,16 +595,14 @@ def log_exception(
     context: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Log an exception with context."""
-    extra = {"exception_type": type(exc).__name__, "exception_message": str(exc)}
+    fields = {"exception_type": type(exc).__name__, "exception_message": str(exc)}
     if context:
-        extra.update(context)
+        fields.update(context)
 
-    logger.error("Exception occurred", exc_info=exc, extra=extra)
+    logger.error("Exception occurred", exc_info=exc, **fields)
 
 
 def log_security_event(event_type: str, details: Dict[str, Any]) -> None:
     """Log security-related events."""
     security_logger = get_logger("security")
-    security_logger.warning(
-        "Security event", extra={"event_type": event_type, **details}
-    )
+    security_logger.warning("Security event", event_type=event_type, **details)
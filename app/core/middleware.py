@@ -5,160 +5,227 @@ This module provides:
 - Request/Response logging middleware
 - Performance monitoring
 - Security headers
-- Request ID tracking
+- Request ID tracking (handled by the request logging middleware)
+
+All middleware is written as pure ASGI classes rather than on top of
+``BaseHTTPMiddleware``, which spawns extra tasks and streams per request.
 """
 
+import base64
+import logging
+import os
+import re
 import time
-import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 from app.core.logging import get_logger, performance_logger
 
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests and responses."""
-
-    def __init__(self, app):
-        super().__init__(app)
+# Static security headers, pre-encoded once for every response
+_SECURITY_HEADERS_DEV: list[tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+]
+# Only add HSTS in production
+_SECURITY_HEADERS_PROD: list[tuple[bytes, bytes]] = [
+    *_SECURITY_HEADERS_DEV,
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains; preload"),
+]
+# Raw header keys read or written by the request logger
+_REQ_ID_KEY = b"x-request-id"
+_CONTENT_LENGTH = b"content-length"
+
+# Client-supplied request IDs are only echoed back if they look like tokens
+_VALID_REQ_ID = re.compile(rb"[A-Za-z0-9_-]{1,64}")
+
+# Proxy headers carrying the original client address
+_XFF = b"x-forwarded-for"
+_XRI = b"x-real-ip"
+
+# Probe and scrape endpoints excluded from request logging
+_UNLOGGED_PATHS = frozenset({"/health", "/metrics"})
+
+# Request headers worth logging, mapped to their log field names
+_LOGGED_HEADERS = {
+    b"user-agent": "user_agent",
+    b"content-length": "content_length",
+    b"content-type": "content_type",
+}
+
+
+def _header_fields(scope: Scope) -> dict[str, str]:
+    """Collect the allow-listed request headers from the raw scope headers."""
+    fields = {}
+    for key, value in scope["headers"]:
+        name = _LOGGED_HEADERS.get(key)
+        if name:
+            fields[name] = value.decode("latin-1")
+    return fields
+
+
+def _new_request_id() -> bytes:
+    """Generate a 22-char URL-safe request ID carrying 128 random bits."""
+    return base64.urlsafe_b64encode(os.urandom(16)).rstrip(b"=")
+
+
+def _request_id(scope: Scope) -> bytes:
+    """Reuse a well-formed client X-Request-ID, otherwise generate a new one."""
+    raw_id = next((v for k, v in scope["headers"] if k == _REQ_ID_KEY), None)
+    if raw_id is None or not _VALID_REQ_ID.fullmatch(raw_id):
+        return _new_request_id()
+    return raw_id
+
+
+def _client_ip(scope: Scope) -> str:
+    """Extract client IP address in a single pass over the raw headers."""
+    forwarded_for = real_ip = None
+    for key, value in scope["headers"]:
+        # Both proxy headers start with "x"; one prefix check skips the rest
+        # (slicing rather than indexing, so an empty header name can't raise)
+        if key[:1] != b"x":
+            continue
+        if key == _XFF:
+            forwarded_for = value
+        elif key == _XRI:
+            real_ip = value
+
+    # Check for forwarded headers (when behind proxy)
+    if forwarded_for:
+        return forwarded_for.split(b",", 1)[0].strip().decode("ascii", "replace")
+    if real_ip:
+        return real_ip.decode("ascii", "replace")
+
+    # Fallback to direct client IP
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RequestLoggingMiddleware:
+    """Middleware for request IDs and logging HTTP requests and responses.
+
+    Only installed when ``settings.enable_request_logging`` is on, so the
+    setting is not re-checked per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.logger = get_logger("requests")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details."""
-        if not settings.enable_request_logging:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in _UNLOGGED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        log_info = self.logger.is_enabled_for(logging.INFO)
 
-        # Generate request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        # Request ID (exposed to handlers as request.state.request_id)
+        raw_id = _request_id(scope)
+        request_id = raw_id.decode("ascii")
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_header = (_REQ_ID_KEY, raw_id)
 
         # Record start time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Log incoming request
-        self.logger.info(
-            "Request started",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "url": str(request.url),
-                "path": request.url.path,
-                "query_params": dict(request.query_params),
-                "headers": dict(request.headers),
-                "client_ip": self._get_client_ip(request),
-                "user_agent": request.headers.get("user-agent"),
-            },
-        )
-
-        try:
-            # Process request
-            response = await call_next(request)
-
-            # Calculate duration
-            duration = time.time() - start_time
-
-            # Log response
+        if log_info:
             self.logger.info(
-                "Request completed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_seconds": round(duration, 4),
-                    "response_size": response.headers.get("content-length"),
-                },
+                "Request started",
+                request_id=request_id,
+                method=method,
+                path=path,
+                query_string=scope["query_string"].decode("latin-1"),
+                client_ip=_client_ip(scope),
+                **_header_fields(scope),
             )
 
-            # Log performance metrics
-            performance_logger.log_request_timing(
-                method=request.method,
-                path=request.url.path,
-                duration=duration,
-                status_code=response.status_code,
-            )
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            return response
+        status_code = 500
+        response_size = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = message.get("headers", ())
+                for key, value in headers:
+                    if key == _CONTENT_LENGTH:
+                        response_size = value
+                        break
+                # Append the pre-encoded request ID as a raw header tuple
+                message["headers"] = [*headers, request_id_header]
+            await send(message)
 
+        try:
+            # Process request
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
             # Calculate duration for failed requests
-            duration = time.time() - start_time
+            duration_ns = time.perf_counter_ns() - start_ns
 
             # Log error
             self.logger.error(
                 "Request failed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "duration_seconds": round(duration, 4),
-                    "exception": str(exc),
-                    "exception_type": type(exc).__name__,
-                },
+                request_id=request_id,
+                method=method,
+                path=path,
+                duration_us=duration_ns // 1000,
+                exception=str(exc),
+                exception_type=type(exc).__name__,
                 exc_info=exc,
             )
 
             # Re-raise the exception
             raise
 
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP address from request."""
-        # Check for forwarded headers (when behind proxy)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+        # Calculate duration
+        duration_ns = time.perf_counter_ns() - start_ns
 
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
+        # Log response
+        if log_info:
+            self.logger.info(
+                "Request completed",
+                request_id=request_id,
+                method=method,
+                path=path,
+                status_code=status_code,
+                duration_us=duration_ns // 1000,
+                response_size=int(response_size) if response_size else None,
+            )
 
-        # Fallback to direct client IP
-        return request.client.host if request.client else "unknown"
+        # Log performance metrics
+        performance_logger.log_request_timing(
+            method=method,
+            path=path,
+            duration_ns=duration_ns,
+            status_code=status_code,
+        )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Middleware for adding security headers to responses."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Add security headers to response."""
-        response = await call_next(request)
-
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=()"
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.headers = (
+            _SECURITY_HEADERS_DEV if settings.debug else _SECURITY_HEADERS_PROD
         )
 
-        # Only add HSTS in production
-        if not settings.debug:
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
-
-        return response
-
-
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware for adding request ID to all requests."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Add request ID to request state."""
-        # Generate or use existing request ID
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *self.headers]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,45 @@
+"""
+Response classes shared across the application.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi import status
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content straight to JSON bytes."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def dump_models(adapter: TypeAdapter, data: Any) -> bytes:
+    """Validate ORM data against a schema and serialize it to JSON bytes."""
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def json_bytes_response(
+    content: bytes, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Wrap already-encoded JSON in a response."""
+    return Response(
+        content=content, status_code=status_code, media_type="application/json"
+    )
+
+
+def model_response(
+    adapter: TypeAdapter, data: Any, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Validate ORM data against a schema and return it as pre-encoded JSON.
+
+    Returning a ``Response`` skips FastAPI's ``response_model`` pass
+    (``jsonable_encoder`` + JSON encoding); pydantic-core validates and
+    serializes straight to bytes instead. Declare ``response_model`` on the
+    route anyway so the OpenAPI schema stays accurate.
+    """
+    return json_bytes_response(dump_models(adapter, data), status_code)
@@ -2,12 +2,15 @@
 Database configuration and connection management.
 """
 
+import time
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
+from app.core.logging import performance_logger
 
 
 class Base(DeclarativeBase):
@@ -16,14 +19,38 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine
+# Create async engine backed by a shared connection pool
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
-    pool_recycle=300,
+    pool_recycle=settings.db_pool_recycle,
 )
 
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    """Record the start time of each statement on the connection."""
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    """Report statements that exceed the slow query threshold."""
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    performance_logger.log_slow_query(statement, duration)
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _discard_query_timer(context):
+    """Drop the start time of a failed statement so later timings stay paired."""
+    conn = context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
 # Create async session maker
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -35,7 +62,4 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get async database session."""
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
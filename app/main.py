@@ -4,47 +4,79 @@ FastAPI application factory and configuration.
 
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.v1.routes import users
 from app.core.config import settings
 from app.core.exceptions import setup_exception_handlers
-from app.core.logging import app_logger, setup_logging
+from app.core.logging import (
+    app_logger,
+    disable_logging,
+    setup_logging,
+    start_logging,
+    stop_logging,
+)
 from app.core.middleware import RequestLoggingMiddleware
+from app.core.responses import ORJSONResponse, json_bytes_response
+from app.db.database import engine
+from app.utils.helpers import shutdown_password_executor
+
+# Static URLs and endpoint bodies, built once at import time
+_PREFIX = settings.api_v1_prefix
+_OPENAPI_URL = f"{_PREFIX}/openapi.json"
+_DOCS_URL = f"{_PREFIX}/docs"
+_REDOC_URL = f"{_PREFIX}/redoc"
+_USERS_PREFIX = f"{_PREFIX}/users"
+
+_ROOT_BODY = {
+    "message": f"Welcome to {settings.app_name}",
+    "version": settings.app_version,
+    "docs": _DOCS_URL,
+}
+# Probes hit /health constantly, so its body is encoded only once
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": settings.app_name})
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
     # Startup
+    start_logging()
     app_logger.info(
         "Application starting",
-        extra={
-            "service": settings.app_name,
-            "version": settings.app_version,
-            "debug": settings.debug,
-            "environment": "development" if settings.debug else "production",
-        },
+        service=settings.app_name,
+        version=settings.app_version,
+        debug=settings.debug,
+        environment="development" if settings.debug else "production",
     )
     yield
     # Shutdown
     app_logger.info("Application shutting down")
+    await engine.dispose()
+    shutdown_password_executor()
+    stop_logging()
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    # Setup logging first
-    setup_logging()
+    # Setup logging first; LOG_LEVEL=NONE skips building handlers altogether
+    if settings.log_level.upper() == "NONE":
+        disable_logging()
+    else:
+        setup_logging()
 
     app = FastAPI(
         title=settings.app_name,
         version=settings.app_version,
         debug=settings.debug,
-        openapi_url=f"{settings.api_v1_prefix}/openapi.json",
-        docs_url=f"{settings.api_v1_prefix}/docs",
-        redoc_url=f"{settings.api_v1_prefix}/redoc",
+        openapi_url=_OPENAPI_URL,
+        docs_url=_DOCS_URL,
+        redoc_url=_REDOC_URL,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Setup exception handlers
@@ -52,6 +84,15 @@ def create_app() -> FastAPI:
 
     # Add middleware in correct order (last added = first executed)
 
+    # Response compression for larger JSON payloads (e.g. user lists);
+    # added before CORS so CORS stays outside the compressed body
+    if settings.enable_gzip:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=settings.gzip_minimum_size,
+            compresslevel=settings.gzip_compress_level,
+        )
+
     # CORS middleware (should be last to handle CORS for all requests)
     app.add_middleware(
         CORSMiddleware,
@@ -68,23 +109,19 @@ def create_app() -> FastAPI:
     # Include routers
     app.include_router(
         users.router,
-        prefix=f"{settings.api_v1_prefix}/users",
+        prefix=_USERS_PREFIX,
         tags=["users"],
     )
 
     @app.get("/")
     async def root():
         """Root endpoint."""
-        return {
-            "message": f"Welcome to {settings.app_name}",
-            "version": settings.app_version,
-            "docs": f"{settings.api_v1_prefix}/docs",
-        }
+        return _ROOT_BODY
 
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "service": settings.app_name}
+        return json_bytes_response(_HEALTH_BYTES)
 
     return app
 
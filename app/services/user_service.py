@@ -4,185 +4,184 @@ User business logic and service layer.
 
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import AlreadyExistsError, NotFoundError
 from app.core.logging import database_logger
 from app.models.user import User, UserCreate, UserUpdate
 
+# Statements with a fixed shape are built once and reused with bound params,
+# so each call skips constructing the statement and its cache key
+_LIST_USERS = select(User).order_by(User.id).limit(bindparam("limit"))
+_LIST_USERS_AFTER = _LIST_USERS.where(User.id > bindparam("after_id"))
+_GET_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_GET_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_DELETE_USER = delete(User).where(User.id == bindparam("user_id")).returning(User.id)
 
-class UserService:
-    """Service class for user operations."""
-
-    def __init__(self, db: AsyncSession):
-        self.db = db
 
-    async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination."""
-        database_logger.debug(
-            "Fetching users from database", extra={"skip": skip, "limit": limit}
-        )
-
-        result = await self.db.execute(select(User).offset(skip).limit(limit))
+class UserService:
+    """Stateless user operations; the database session is passed per call."""
+
+    @staticmethod
+    async def get_users(
+        db: AsyncSession, after_id: Optional[int] = None, limit: int = 100
+    ) -> List[User]:
+        """Get users ordered by ID, starting after ``after_id`` (keyset pagination)."""
+        # Seek on the primary key instead of OFFSET, so deep pages stay cheap
+        if after_id is None:
+            result = await db.execute(_LIST_USERS, {"limit": limit})
+        else:
+            result = await db.execute(
+                _LIST_USERS_AFTER, {"limit": limit, "after_id": after_id}
+            )
         users = list(result.scalars().all())
 
         database_logger.debug(
-            "Users fetched from database",
-            extra={"count": len(users), "skip": skip, "limit": limit},
+            "Users fetched from database", count=len(users), after_id=after_id
         )
         return users
 
-    async def get_user(self, user_id: int) -> Optional[User]:
+    @staticmethod
+    async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
         """Get user by ID."""
-        database_logger.debug(
-            "Fetching user by ID from database", extra={"user_id": user_id}
-        )
-
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await db.execute(_GET_USER_BY_ID, {"user_id": user_id})
         user = result.scalar_one_or_none()
 
-        if user:
-            database_logger.debug(
-                "User found in database",
-                extra={"user_id": user_id, "email": user.email},
-            )
-        else:
-            database_logger.debug(
-                "User not found in database", extra={"user_id": user_id}
-            )
-
-        return user
-
-    async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email."""
         database_logger.debug(
-            "Fetching user by email from database", extra={"email": email}
+            "User fetched from database", user_id=user_id, found=user is not None
         )
+        return user
 
-        result = await self.db.execute(select(User).where(User.email == email))
+    @staticmethod
+    async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+        """Get user by email."""
+        result = await db.execute(_GET_USER_BY_EMAIL, {"email": email})
         user = result.scalar_one_or_none()
 
-        if user:
-            database_logger.debug(
-                "User found by email in database",
-                extra={"email": email, "user_id": user.id},
-            )
-        else:
-            database_logger.debug(
-                "User not found by email in database", extra={"email": email}
-            )
-
+        database_logger.debug(
+            "User fetched by email from database",
+            user_id=user.id if user else None,
+        )
         return user
 
-    async def create_user(self, user_data: UserCreate) -> User:
-        """Create a new user."""
-        database_logger.info(
-            "Creating new user in database",
-            extra={"email": user_data.email, "first_name": user_data.first_name},
-        )
+    @staticmethod
+    async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
+        """Create a new user, failing if the email is already registered."""
+        # Cheap indexed lookup first, so duplicate signups don't pay for bcrypt;
+        # ON CONFLICT below still covers a concurrent insert of the same email
+        if await UserService.get_user_by_email(db, user_data.email):
+            database_logger.warning("Attempt to create user with existing email")
+            raise AlreadyExistsError("Email already registered")
 
         try:
-            # Hash the password before storing
-            from app.utils.helpers import get_password_hash
-
-            user_dict = user_data.model_dump()
-            hashed_password = get_password_hash(user_dict.pop("password"))
-
-            db_user = User(**user_dict, hashed_password=hashed_password)
-            self.db.add(db_user)
-            await self.db.commit()
-            await self.db.refresh(db_user)
-
-            database_logger.info(
-                "User created successfully in database",
-                extra={"user_id": db_user.id, "email": db_user.email},
+            # Hash the password before storing; bcrypt is CPU-bound, so it
+            # runs on a worker thread instead of blocking the event loop
+            from app.utils.helpers import get_password_hash_async
+
+            hashed_password = await get_password_hash_async(user_data.password)
+
+            # INSERT ... ON CONFLICT, so a racing duplicate can't slip past the check
+            result = await db.execute(
+                insert(User)
+                .values(
+                    email=user_data.email,
+                    first_name=user_data.first_name,
+                    last_name=user_data.last_name,
+                    is_active=user_data.is_active,
+                    hashed_password=hashed_password,
+                )
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(User)
             )
-
-            return db_user
+            db_user = result.scalar_one_or_none()
+            await db.commit()
         except Exception as e:
             database_logger.error(
                 "Failed to create user in database",
-                extra={
-                    "email": user_data.email,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
+                error=str(e),
+                error_type=type(e).__name__,
             )
-            await self.db.rollback()
+            await db.rollback()
             raise
 
-    async def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[User]:
-        """Update an existing user."""
-        database_logger.info("Updating user in database", extra={"user_id": user_id})
+        if not db_user:
+            database_logger.warning("Attempt to create user with existing email")
+            raise AlreadyExistsError("Email already registered")
 
-        try:
-            db_user = await self.get_user(user_id)
-            if db_user:
-                update_data = user_data.model_dump(exclude_unset=True)
-
-                database_logger.debug(
-                    "Applying user updates",
-                    extra={
-                        "user_id": user_id,
-                        "update_fields": list(update_data.keys()),
-                    },
-                )
-
-                for field, value in update_data.items():
-                    setattr(db_user, field, value)
-                await self.db.commit()
-                await self.db.refresh(db_user)
+        database_logger.info(
+            "User created successfully in database", user_id=db_user.id
+        )
+        return db_user
 
-                database_logger.info(
-                    "User updated successfully in database",
-                    extra={"user_id": user_id, "email": db_user.email},
+    @staticmethod
+    async def update_user(
+        db: AsyncSession, user_id: int, user_data: UserUpdate
+    ) -> User:
+        """Update an existing user."""
+        # Read only the fields the client sent instead of a full model_dump()
+        update_data = {
+            name: getattr(user_data, name) for name in user_data.model_fields_set
+        }
+        if not update_data:
+            db_user = await UserService.get_user(db, user_id)
+        else:
+            try:
+                # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE
+                result = await db.execute(
+                    update(User)
+                    .where(User.id == user_id)
+                    .values(**update_data)
+                    .returning(User)
                 )
-            else:
-                database_logger.warning(
-                    "Attempted to update non-existent user", extra={"user_id": user_id}
+                db_user = result.scalar_one_or_none()
+                await db.commit()
+            except Exception as e:
+                database_logger.error(
+                    "Failed to update user in database",
+                    user_id=user_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
                 )
+                await db.rollback()
+                raise
 
-            return db_user
-        except Exception as e:
-            database_logger.error(
-                "Failed to update user in database",
-                extra={
-                    "user_id": user_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
+        if not db_user:
+            database_logger.warning(
+                "Attempted to update non-existent user", user_id=user_id
             )
-            await self.db.rollback()
-            raise
+            raise NotFoundError("User not found")
 
-    async def delete_user(self, user_id: int) -> bool:
-        """Delete a user."""
-        database_logger.info("Deleting user from database", extra={"user_id": user_id})
+        database_logger.info(
+            "User updated successfully in database",
+            user_id=user_id,
+            update_fields=list(update_data),
+        )
+        return db_user
 
+    @staticmethod
+    async def delete_user(db: AsyncSession, user_id: int) -> None:
+        """Delete a user."""
         try:
-            db_user = await self.get_user(user_id)
-            if db_user:
-                await self.db.delete(db_user)
-                await self.db.commit()
-
-                database_logger.info(
-                    "User deleted successfully from database",
-                    extra={"user_id": user_id},
-                )
-                return True
-            else:
-                database_logger.warning(
-                    "Attempted to delete non-existent user", extra={"user_id": user_id}
-                )
-                return False
+            # Single DELETE ... RETURNING round-trip instead of SELECT + DELETE
+            result = await db.execute(_DELETE_USER, {"user_id": user_id})
+            deleted_id = result.scalar_one_or_none()
+            await db.commit()
         except Exception as e:
             database_logger.error(
                 "Failed to delete user from database",
-                extra={
-                    "user_id": user_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
+                user_id=user_id,
+                error=str(e),
+                error_type=type(e).__name__,
             )
-            await self.db.rollback()
+            await db.rollback()
             raise
+
+        if deleted_id is None:
+            database_logger.warning(
+                "Attempted to delete non-existent user", user_id=user_id
+            )
+            raise NotFoundError("User not found")
+
+        database_logger.info("User deleted successfully from database", user_id=user_id)
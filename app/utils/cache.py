@@ -0,0 +1,74 @@
+"""
+In-process async caching utilities.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark a finished load's exception as retrieved to avoid asyncio warnings."""
+    if not task.cancelled():
+        task.exception()
+
+
+class AsyncTTLCache:
+    """Small per-process TTL cache with request coalescing.
+
+    Concurrent misses for the same key share a single loader call, so a burst
+    of identical requests hits the database once. ``invalidate()`` drops every
+    entry and detaches in-flight loads, so nothing read before a write is
+    served after it.
+
+    The loader may outlive the request that started it, so it must not use
+    request-scoped resources such as the request's database session.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, calling loader on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, self._generation))
+            # A load whose callers all went away still has its error retrieved
+            task.add_done_callback(_retrieve_exception)
+            self._pending[key] = task
+
+        # Shield so a cancelled caller does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]], generation: int
+    ) -> Any:
+        """Run loader and store its result unless the cache was invalidated."""
+        try:
+            value = await loader()
+        finally:
+            if self._pending.get(key) is asyncio.current_task():
+                del self._pending[key]
+
+        if self.ttl > 0 and generation == self._generation:
+            if len(self._entries) >= self.maxsize:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop all cached entries and detach in-flight loads."""
+        self._generation += 1
+        self._entries.clear()
+        self._pending.clear()
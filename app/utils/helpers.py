@@ -2,7 +2,10 @@
 Utility functions and helpers.
 """
 
+import asyncio
+import os
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Union
 
@@ -14,6 +17,29 @@ from app.core.config import settings
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so hashing scales across cores on its own pool
+# without competing with the loop's default executor. Created on first use
+# so every lifespan cycle (and every forked worker) gets a live pool.
+_password_executor: ThreadPoolExecutor | None = None
+
+
+def get_password_executor() -> ThreadPoolExecutor:
+    """Return the password hashing pool, creating it if needed."""
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="password-hash"
+        )
+    return _password_executor
+
+
+def shutdown_password_executor() -> None:
+    """Shut down the password hashing pool; the next use creates a new one."""
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False)
+        _password_executor = None
+
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta | None = None
@@ -43,6 +69,14 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """Generate password hash off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_password_executor(), get_password_hash, password
+    )
+
+
 def generate_random_string(length: int = 32) -> str:
     """Generate a random string of specified length."""
     return secrets.token_urlsafe(length)